@@ -0,0 +1,221 @@
+import msgspec, cramjam
+from io import BytesIO
+from enum import Enum
+from typing import Any, Optional, Dict, Tuple
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import pickle, threading
+
+# Decoding helpers shared by the viewer and its decode worker processes. This
+# module must stay free of import side effects: worker processes import it to
+# unpickle decode_in_worker.
+
+
+class SerializationType(Enum):
+    GOB = "gob"
+    MSG_PACK = "msgpack"
+    JSON = "json"
+    GO_JSON = "gojson"
+
+
+class CompressionAlgorithm(Enum):
+    NONE = "none"
+    ZIP = "zip"
+    SNAPPY = "snappy"
+    LZ4 = "lz4"
+
+
+# Values at least this large are decoded in a worker process to keep the
+# GIL free for other requests; smaller ones are cheaper to decode in place
+OFFLOAD_DECODE_THRESHOLD = 1024 * 1024
+DECODE_TIMEOUT = 5
+DECODE_MAX_WORKERS = 2
+
+# Decoders are reusable and thread-safe, so build them once
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+
+# Key prefixes that select the compression and serialization of a value
+_COMPRESSION_MAP = {
+    "c0": CompressionAlgorithm.NONE,
+    "c1": CompressionAlgorithm.ZIP,
+    "c2": CompressionAlgorithm.SNAPPY,
+    "c3": CompressionAlgorithm.LZ4,
+}
+_SERIALIZATION_MAP = {
+    "s2": SerializationType.MSG_PACK,
+    "s3": SerializationType.JSON,
+    "s4": SerializationType.GO_JSON,
+}
+
+
+class CacheError(Exception):
+    def __init__(self, description: str):
+        self.description = description
+        super().__init__(description)
+
+
+class RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves plain data types, never arbitrary callables."""
+
+    ALLOWED_GLOBALS = {
+        ("builtins", "set"),
+        ("builtins", "frozenset"),
+        ("builtins", "bytearray"),
+        ("builtins", "complex"),
+        ("collections", "OrderedDict"),
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "time"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    }
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in self.ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Global '{module}.{name}' is not allowed")
+
+
+def get_compression_algorithm(cache_key: str) -> CompressionAlgorithm:
+    if len(cache_key) > 2:
+        return _COMPRESSION_MAP.get(cache_key[:2], CompressionAlgorithm.ZIP)
+    return CompressionAlgorithm.ZIP
+
+
+def get_serialization_type(cache_key: str) -> SerializationType:
+    if len(cache_key) > 4:
+        parts = cache_key.split(".", 1)
+        if len(parts) > 1 and len(parts[1]) > 1:
+            return _SERIALIZATION_MAP.get(parts[1][:2], SerializationType.GOB)
+    return SerializationType.GOB
+
+
+def decode_gob(data: bytes) -> Any:
+    """Decodes values stored without a serialization prefix.
+
+    There is no maintained gob decoder for Python and Go services usually
+    write msgpack, so try that first. Fall back to unpickling with only plain
+    data types allowed, so crafted payloads cannot execute code.
+    """
+    try:
+        return _MSGPACK_DECODER.decode(data)
+    except msgspec.DecodeError:
+        return RestrictedUnpickler(BytesIO(data)).load()
+
+
+def decode(
+    data: bytes,
+    obj: Any,
+    compression_algorithm: CompressionAlgorithm,
+    serialization_type: SerializationType,
+) -> Optional[Exception]:
+    try:
+        # Decompress first
+        try:
+            # cramjam returns a Buffer, which the decoders read without copying
+            if compression_algorithm == CompressionAlgorithm.SNAPPY:
+                decompressed = cramjam.snappy.decompress_raw(data)
+            elif compression_algorithm == CompressionAlgorithm.ZIP:
+                decompressed = cramjam.gzip.decompress(data)
+            elif compression_algorithm == CompressionAlgorithm.LZ4:
+                # Block format with the uncompressed size prepended, as lz4.block writes it
+                decompressed = cramjam.lz4.decompress_block(data)
+            else:  # NONE
+                decompressed = data
+        except Exception as decompress_error:
+            raise CacheError(f"Decompression failed: {str(decompress_error)}")
+
+        # Deserialize; the msgspec decoders read any bytes-like object, so the
+        # decompressed buffer is passed as-is without a bytes() or str copy
+        try:
+            if serialization_type == SerializationType.MSG_PACK:
+                result = _MSGPACK_DECODER.decode(decompressed)
+            elif serialization_type == SerializationType.GOB:
+                result = decode_gob(decompressed)
+            elif serialization_type in (
+                SerializationType.JSON,
+                SerializationType.GO_JSON,
+            ):
+                result = _JSON_DECODER.decode(decompressed)
+
+            if isinstance(obj, dict):
+                obj.clear()
+                obj.update(result if isinstance(result, dict) else {"value": result})
+            else:
+                for key, value in (
+                    result if isinstance(result, dict) else {"value": result}
+                ).items():
+                    setattr(obj, key, value)
+            return None
+
+        except Exception as deserialize_error:
+            raise CacheError(f"Deserialization failed: {str(deserialize_error)}")
+
+    except Exception as e:
+        return e
+
+
+def decode_in_worker(
+    data: bytes,
+    compression_algorithm: CompressionAlgorithm,
+    serialization_type: SerializationType,
+) -> Tuple[Dict, Optional[str]]:
+    """Runs decode in a worker process and returns (result, error message)."""
+    result = {}
+    error = decode(data, result, compression_algorithm, serialization_type)
+    return result, str(error) if error else None
+
+
+_decode_pool: Optional[ProcessPoolExecutor] = None
+_decode_pool_lock = threading.Lock()
+
+
+def get_decode_pool() -> ProcessPoolExecutor:
+    # Created on first use so small-value sessions never start worker processes
+    global _decode_pool
+    with _decode_pool_lock:
+        if _decode_pool is None:
+            _decode_pool = ProcessPoolExecutor(max_workers=DECODE_MAX_WORKERS)
+        return _decode_pool
+
+
+def recycle_decode_pool(pool: ProcessPoolExecutor) -> None:
+    """Replaces a pool that is broken or whose workers are stuck on timed out values.
+
+    A running task cannot be cancelled, so the old pool is shut down without
+    waiting: its queued tasks are dropped and its workers exit once their
+    current value is done, while new values go to a fresh pool.
+    """
+    global _decode_pool
+    with _decode_pool_lock:
+        if _decode_pool is pool:
+            _decode_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def decode_in_pool(
+    data: bytes,
+    compression_algorithm: CompressionAlgorithm,
+    serialization_type: SerializationType,
+) -> Tuple[Dict, Optional[str]]:
+    """Decodes data in a worker process and returns (result, error message)."""
+    pool = get_decode_pool()
+    try:
+        future = pool.submit(
+            decode_in_worker, data, compression_algorithm, serialization_type
+        )
+        return future.result(timeout=DECODE_TIMEOUT)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed on a decompression bomb), which breaks
+        # the whole pool; replace it so later values can still be decoded
+        recycle_decode_pool(pool)
+        return {}, "Decoding worker crashed, please retry"
+    except FutureTimeoutError:
+        recycle_decode_pool(pool)
+        return {}, f"Decoding timed out after {DECODE_TIMEOUT}s"
+    except CancelledError:
+        # Dropped from the queue when another value's timeout recycled the pool
+        return {}, "Decoding was cancelled, please retry"
@@ -1,39 +1,93 @@
 import dash
-from dash import html, dcc, Input, Output, State
+from dash import html, dcc, Input, Output, State, callback, clientside_callback
 import dash_ag_grid as dag
-import redis, json, msgpack, gzip, snappy, lz4.block
-from io import BytesIO
-from enum import Enum
+import redis, json, orjson
 from flask import request, jsonify
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, Iterator, List, Tuple
 from dataclasses import dataclass
-import logging, pickle, pandas as pd, html as html_lib
+import logging, hashlib, pandas as pd
 from datetime import datetime
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import JsonLexer
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import freeze_support
 import webbrowser, threading, time
 
+from cache_codec import (
+    CompressionAlgorithm,
+    SerializationType,
+    OFFLOAD_DECODE_THRESHOLD,
+    decode,
+    decode_in_pool,
+    get_compression_algorithm,
+    get_serialization_type,
+)
+
+# Seconds a SCAN result is reused for the same search pattern
+KEYS_CACHE_TTL = 2
+
+# Budget for the decoded-value cache, counted in raw value bytes; decoded
+# objects are larger than their raw bytes, so memory use is a multiple of this
+VALUE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Keys per metadata pipeline, and how many pipelines may run at once
+METADATA_CHUNK_SIZE = 1000
+METADATA_MAX_WORKERS = 8
 
-# Enums and basic classes remain the same
-class SerializationType(Enum):
-    GOB = "gob"
-    MSG_PACK = "msgpack"
-    JSON = "json"
-    GO_JSON = "gojson"
+# Preview formatting options, combined once instead of on every row click
+_ORJSON_PREVIEW_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
-class CompressionAlgorithm(Enum):
-    NONE = "none"
-    ZIP = "zip"
-    SNAPPY = "snappy"
-    LZ4 = "lz4"
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entries.
 
+    Entries are evicted past maxsize entries, or past maxbytes of total weight
+    when entries are put with a weight.
+    """
 
-class CacheError(Exception):
-    def __init__(self, description: str):
-        self.description = description
-        super().__init__(description)
+    def __init__(self, maxsize: int = 1024, maxbytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._weights: Dict[Any, int] = {}
+        self._total_weight = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Any, value: Any, weight: int = 0) -> None:
+        if self.maxbytes is not None and weight > self.maxbytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._data[key] = value
+            self._weights[key] = weight
+            self._total_weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self._total_weight > self.maxbytes
+            ):
+                self._remove(next(iter(self._data)))
+
+    def evict(self, predicate) -> None:
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self._total_weight = 0
+
+    def _remove(self, key: Any) -> None:
+        # Caller must hold the lock
+        if key in self._data:
+            del self._data[key]
+            self._total_weight -= self._weights.pop(key)
 
 
 @dataclass
@@ -46,22 +100,40 @@ class RedisInstance:
 
     def connect(self) -> None:
         if not self.client:
-            self.client = redis.Redis(
+            # A shared pool lets parallel pipelines use separate connections;
+            # callers wait up to 5s for a free one instead of failing outright
+            pool = redis.BlockingConnectionPool(
                 host=self.host,
                 port=self.port,
                 db=self.db,
                 password=self.password,
+                max_connections=32,
+                timeout=5,
+                socket_keepalive=True,
+                socket_timeout=2.0,
                 decode_responses=False,
             )
+            self.client = redis.Redis(connection_pool=pool)
 
     def get_string(self, key: str) -> Optional[bytes]:
         self.connect()
         return self.client.get(key)
 
+    def get_string_length(self, key: str) -> int:
+        self.connect()
+        return self.client.strlen(key)
+
 
 class RedisCacheViewer:
     def __init__(self):
         self.redis_instance = None
+        # Decoded values keyed by (redis_key, digest) so unchanged blobs skip
+        # decoding, weighted by raw value size to bound memory use
+        self.value_cache = LRUCache(maxsize=1024, maxbytes=VALUE_CACHE_MAX_BYTES)
+        # Recent SCAN results keyed by pattern, so rapid refreshes reuse them
+        self.keys_cache = LRUCache(maxsize=16)
+        # Cleared if the server rejects SCAN ... TYPE (Redis < 6)
+        self.scan_type_supported = True
         self.setup_logging()
         # Auto-connect on initialization
         self.connect_to_redis(
@@ -84,70 +156,148 @@ class RedisCacheViewer:
             self.logger.error(f"Failed to connect to Redis: {str(e)}")
             return False
 
-    def get_keys(self, pattern: str = "*") -> List[str]:
+    def get_keys(self, pattern: str = "*") -> List[Tuple[str, str]]:
+        """Returns (original_key, display_key) pairs sorted by display key."""
         if not self.redis_instance or not self.redis_instance.client:
             self.logger.error("Redis instance or client is None")
             return []
+        cached = self.keys_cache.get(pattern)
+        if cached is not None and time.monotonic() - cached[0] < KEYS_CACHE_TTL:
+            return cached[1]
+        # MATCH runs against the full key, so the search is rechecked on the
+        # display key below; the server-side glob only narrows what is sent back
+        needle = pattern.lower() if pattern and pattern != "*" else ""
         try:
+            # Redis applies the MATCH and TYPE filters server-side, so only
+            # matching string keys are sent back; scan_iter keeps issuing SCAN
+            # until the cursor is 0
             keys = []
-            cursor = 0
-            while True:
-                # Redis internally scans ~5000 keys
-                # Applies pattern matching to ALL scanned keys
-                # Returns only the matches found within those ~5000 keys
-                cursor, partial_keys = self.redis_instance.client.scan(
-                    cursor=cursor, match=pattern, count=5000
-                )
-                # Continue until cursor = 0 (meaning we've scanned ALL keys in the database)
-                keys.extend(
-                    [
-                        key.decode("utf-8") if isinstance(key, bytes) else key
-                        for key in partial_keys
-                    ]
-                )
-                if cursor == 0:
-                    break
-            return sorted(keys)
+            for key in self._scan_string_keys(pattern_to_glob(pattern)):
+                key = key.decode("utf-8") if isinstance(key, bytes) else key
+                # The display key is the part after "go."
+                display_key = key.split("go.", 1)[-1]
+                if needle in display_key.lower():
+                    keys.append((key, display_key))
+            keys.sort(key=lambda pair: pair[1].lower())
+            self.keys_cache.put(pattern, (time.monotonic(), keys))
+            return keys
         except Exception as e:
             self.logger.error(f"Failed to fetch keys: {str(e)}")
             return []
 
+    def _scan_string_keys(self, match: str) -> Iterator[bytes]:
+        client = self.redis_instance.client
+        if self.scan_type_supported:
+            scanned_any = False
+            try:
+                for key in client.scan_iter(match=match, count=10000, _type="string"):
+                    scanned_any = True
+                    yield key
+                return
+            except redis.ResponseError as e:
+                # Redis < 6 rejects SCAN ... TYPE as a syntax error; fall back
+                # only then, and only if no keys were yielded yet
+                if scanned_any or "syntax" not in str(e).lower():
+                    raise
+                self.logger.warning("SCAN TYPE unsupported, scanning all key types")
+                self.scan_type_supported = False
+        yield from client.scan_iter(match=match, count=10000)
+
     def get_ttl(self, key: str) -> str:
         try:
-            ttl_seconds = self.redis_instance.client.ttl(key)
-            if ttl_seconds > -1:
-                ttl_minutes = ttl_seconds / 60
-                if ttl_minutes >= 1:
-                    return f"{int(ttl_minutes)} min"
-                return "< 1 min"
-            return "No TTL"
+            return format_ttl(self.redis_instance.client.ttl(key))
         except Exception as e:
             return f"Error: {str(e)}"
 
-    def get_value(self, key: str) -> Optional[Dict]:
+    def get_keys_metadata(self, keys: List[str]) -> List[Tuple[str, Optional[int]]]:
+        """Returns (ttl, size in bytes) for each key using pipelined round-trips.
+
+        Large key lists are split into chunks whose pipelines run concurrently
+        on separate connections.
+        """
+        chunks = [
+            keys[i : i + METADATA_CHUNK_SIZE]
+            for i in range(0, len(keys), METADATA_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return self._fetch_metadata_chunk(keys)
+
+        metadata = []
+        with ThreadPoolExecutor(max_workers=METADATA_MAX_WORKERS) as executor:
+            for chunk_metadata in executor.map(self._fetch_metadata_chunk, chunks):
+                metadata.extend(chunk_metadata)
+        return metadata
+
+    def _fetch_metadata_chunk(self, keys: List[str]) -> List[Tuple[str, Optional[int]]]:
+        if not keys:
+            return []
+        try:
+            pipe = self.redis_instance.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.ttl(key)
+                # STRLEN returns the value length without sending the value over the wire
+                pipe.strlen(key)
+            results = pipe.execute(raise_on_error=False)
+        except Exception as e:
+            self.logger.error(f"Failed to fetch keys metadata: {str(e)}")
+            return [(f"Error: {str(e)}", None)] * len(keys)
+
+        metadata = []
+        for ttl_seconds, size in zip(results[0::2], results[1::2]):
+            if isinstance(ttl_seconds, Exception):
+                ttl = f"Error: {str(ttl_seconds)}"
+            else:
+                ttl = format_ttl(ttl_seconds)
+            metadata.append((ttl, None if isinstance(size, Exception) else size))
+        return metadata
+
+    def get_value(
+        self,
+        key: str,
+        compression_algorithm: Optional[CompressionAlgorithm] = None,
+        serialization_type: Optional[SerializationType] = None,
+    ) -> Optional[Dict]:
         try:
-            compression_algorithm = get_compression_algorithm(key)
-            serialization_type = get_serialization_type(key)
+            # Callers that already know the key's formats can pass them in
+            if compression_algorithm is None:
+                compression_algorithm = get_compression_algorithm(key)
+            if serialization_type is None:
+                serialization_type = get_serialization_type(key)
 
             data = self.redis_instance.get_string(key)
             if not data:
                 return None
-
-            result = {}
-            error = decode(data, result, compression_algorithm, serialization_type)
+            # Keyed on a digest of the raw bytes, so any overwrite misses the cache
+            cache_key = (key, hashlib.blake2b(data, digest_size=16).digest())
+            cached = self.value_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            if len(data) >= OFFLOAD_DECODE_THRESHOLD:
+                result, error = decode_in_pool(
+                    data, compression_algorithm, serialization_type
+                )
+            else:
+                result = {}
+                error = decode(data, result, compression_algorithm, serialization_type)
             if error:
                 return {"error": str(error)}
+            # Drop entries for older versions of this key before caching the new one
+            self.value_cache.evict(lambda cached_key: cached_key[0] == key)
+            self.value_cache.put(cache_key, result, weight=len(data))
             return result
         except Exception as e:
             return {"error": str(e)}
 
+    def invalidate_value(self, key: str) -> None:
+        self.value_cache.evict(lambda cache_key: cache_key[0] == key)
+        self.keys_cache.clear()
+
     def get_object_size(self, key: str) -> Optional[int]:
         """Returns the size of the cached object in bytes."""
         try:
-            data = self.redis_instance.get_string(key)
-            if data is not None:
-                return len(data)
-            return None
+            # STRLEN is O(1) and avoids transferring the value itself
+            return self.redis_instance.get_string_length(key)
         except Exception as e:
             self.logger.error(f"Failed to get object size: {str(e)}")
             return None
@@ -170,91 +320,48 @@ class RedisCacheViewer:
             return {"connected": False, "error": str(e)}
 
 
-def get_compression_algorithm(cache_key: str) -> CompressionAlgorithm:
-    if len(cache_key) > 2:
-        prefix = cache_key[:2]
-        if prefix == "c1":
-            return CompressionAlgorithm.ZIP
-        elif prefix == "c2":
-            return CompressionAlgorithm.SNAPPY
-        elif prefix == "c3":
-            return CompressionAlgorithm.LZ4
-        elif prefix == "c0":
-            return CompressionAlgorithm.NONE
-    return CompressionAlgorithm.ZIP
-
-
-def get_serialization_type(cache_key: str) -> SerializationType:
-    if len(cache_key) > 4:
-        parts = cache_key.split(".", 1)
-        if len(parts) > 1 and len(parts[1]) > 1:
-            prefix = parts[1][:2]
-            if prefix == "s2":
-                return SerializationType.MSG_PACK
-            elif prefix == "s3":
-                return SerializationType.JSON
-            elif prefix == "s4":
-                return SerializationType.GO_JSON
-    return SerializationType.GOB
-
-
-def decode(
-    data: bytes,
-    obj: Any,
-    compression_algorithm: CompressionAlgorithm,
-    serialization_type: SerializationType,
-) -> Optional[Exception]:
+def pattern_to_glob(pattern: Optional[str]) -> str:
+    """Converts a search substring into a case-insensitive Redis glob.
+
+    SCAN MATCH is case-sensitive, so each letter becomes a ``[xX]`` class and
+    glob metacharacters are escaped to keep the substring literal.
+    """
+    if not pattern or pattern == "*":
+        return "*"
+    parts = []
+    for char in pattern:
+        # Redis globs match bytes, so only single-byte ASCII letters get a class
+        if char.isascii() and char.isalpha():
+            parts.append(f"[{char.lower()}{char.upper()}]")
+        elif char in "*?[]\\":
+            parts.append(f"\\{char}")
+        else:
+            parts.append(char)
+    return f"*{''.join(parts)}*"
+
+
+def format_ttl(ttl_seconds: int) -> str:
+    if ttl_seconds > -1:
+        ttl_minutes = ttl_seconds / 60
+        if ttl_minutes >= 1:
+            return f"{int(ttl_minutes)} min"
+        return "< 1 min"
+    return "No TTL"
+
+
+def format_json(value: Any) -> str:
     try:
-        # Decompress first
-        try:
-            if compression_algorithm == CompressionAlgorithm.SNAPPY:
-                decompressed = snappy.decompress(data)
-            elif compression_algorithm == CompressionAlgorithm.ZIP:
-                buffer = BytesIO(data)
-                with gzip.GzipFile(fileobj=buffer, mode="rb") as gz:
-                    decompressed = gz.read()
-            elif compression_algorithm == CompressionAlgorithm.LZ4:
-                decompressed = lz4.block.decompress(data)
-            else:  # NONE
-                decompressed = data
-        except Exception as decompress_error:
-            raise CacheError(f"Decompression failed: {str(decompress_error)}")
-
-        # Deserialize
-        try:
-            if serialization_type == SerializationType.MSG_PACK:
-                result = msgpack.unpackb(decompressed, raw=False)
-            elif serialization_type == SerializationType.GOB:
-                result = pickle.loads(decompressed)
-            elif serialization_type in (
-                SerializationType.JSON,
-                SerializationType.GO_JSON,
-            ):
-                result = json.loads(decompressed.decode("utf-8"))
-
-            if isinstance(obj, dict):
-                obj.clear()
-                obj.update(result if isinstance(result, dict) else {"value": result})
-            else:
-                for key, value in (
-                    result if isinstance(result, dict) else {"value": result}
-                ).items():
-                    setattr(obj, key, value)
-            return None
-
-        except Exception as deserialize_error:
-            raise CacheError(f"Deserialization failed: {str(deserialize_error)}")
-
-    except Exception as e:
-        return e
+        return orjson.dumps(value, option=_ORJSON_PREVIEW_OPTIONS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits; stdlib json handles them
+        return json.dumps(value, indent=2)
 
 
-# Initialize the Dash app
-app = dash.Dash(__name__, suppress_callback_exceptions=True)
-cache_viewer = RedisCacheViewer()
+# Created in create_app so decode worker processes, which re-import this
+# script, never connect to Redis or build the Dash app
+cache_viewer: Optional[RedisCacheViewer] = None
 
-# Add Pygments CSS
-app.index_string = """
+INDEX_STRING = """
 <!DOCTYPE html>
 <html>
     <head>
@@ -311,210 +418,237 @@ app.index_string = """
 </html>
 """
 
-# Update the layout - remove the Style component
-app.layout = html.Div(
-    [
-        dcc.Store(id="refresh-trigger", data=0),
-        html.H1(
-            "REDIS CACHE VIEWER",
-            style={
-                "textAlign": "left",
-                "marginBottom": "20px",
-                "fontSize": "28px",
-                "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
-                "fontWeight": "600",
-                "letterSpacing": "1px",
-                "textTransform": "uppercase",
-                "color": "#ffffff",
-            },
-        ),
-        html.Link(
-            rel="stylesheet",
-            href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css",
-        ),
-        dcc.Input(
-            id="search-pattern",
-            type="text",
-            placeholder="Search Pattern (e.g., *)",
-            value="",
-            style={
-                "width": "calc(40% - 60px)",
-                "marginBottom": "20px",
-                "backgroundColor": "#3d3d3d",
-                "color": "#ffffff",
-                "border": "1px solid #4d4d4d",
-                "borderRadius": "10px",
-                "height": "40px",
-                "padding": "0 20px",
-                "fontSize": "14px",
-                "outline": "none",
-                "transition": "border-color 0.3s ease",
-            },
-        ),
-        html.Div(
-            [
-                # Left column - Keys Table with metadata
-                html.Div(
-                    [
-                        html.Div(
-                            [  # Wrapper div for header row
-                                html.Div(
-                                    [  # Left side - CACHE KEYS and refresh button
-                                        html.H3(
-                                            "CACHE KEYS",
+
+def build_layout() -> html.Div:
+    return html.Div(
+        [
+            dcc.Store(id="refresh-trigger", data=0),
+            html.H1(
+                "REDIS CACHE VIEWER",
+                style={
+                    "textAlign": "left",
+                    "marginBottom": "20px",
+                    "fontSize": "28px",
+                    "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
+                    "fontWeight": "600",
+                    "letterSpacing": "1px",
+                    "textTransform": "uppercase",
+                    "color": "#ffffff",
+                },
+            ),
+            html.Link(
+                rel="stylesheet",
+                href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css",
+            ),
+            dcc.Input(
+                id="search-pattern",
+                type="text",
+                placeholder="Search Pattern (e.g., *)",
+                value="",
+                # Wait for 300ms of idle typing before rescanning the keyspace
+                debounce=0.3,
+                style={
+                    "width": "calc(40% - 60px)",
+                    "marginBottom": "20px",
+                    "backgroundColor": "#3d3d3d",
+                    "color": "#ffffff",
+                    "border": "1px solid #4d4d4d",
+                    "borderRadius": "10px",
+                    "height": "40px",
+                    "padding": "0 20px",
+                    "fontSize": "14px",
+                    "outline": "none",
+                    "transition": "border-color 0.3s ease",
+                },
+            ),
+            html.Div(
+                [
+                    # Left column - Keys Table with metadata
+                    html.Div(
+                        [
+                            html.Div(
+                                [  # Wrapper div for header row
+                                    html.Div(
+                                        [  # Left side - CACHE KEYS and refresh button
+                                            html.H3(
+                                                "CACHE KEYS",
+                                                style={
+                                                    "fontSize": "22px",
+                                                    "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
+                                                    "fontWeight": "600",
+                                                    "letterSpacing": "1px",
+                                                    "textTransform": "uppercase",
+                                                    "color": "#ffffff",
+                                                    "marginBottom": "5px",
+                                                    "display": "inline-block",
+                                                    "marginRight": "5px",
+                                                },
+                                            ),
+                                            html.Button(
+                                                html.I(className="fas fa-sync-alt"),
+                                                id="refresh-button",
+                                                className="refresh-button",
+                                                n_clicks=0,
+                                            ),
+                                        ],
+                                        style={
+                                            "display": "flex",
+                                            "alignItems": "center",
+                                        },
+                                    ),
+                                    # Right side - Total Keys
+                                    html.H1(
+                                        id="total-keys",
+                                        style={
+                                            "color": "#a6a6a6",
+                                            "fontSize": "14px",
+                                            "fontFamily": "'Inter', sans-serif",
+                                            "marginBottom": "5px",
+                                            "lineHeight": "22px",
+                                            "paddingTop": "15px",
+                                        },
+                                    ),
+                                ],
+                                style={
+                                    "display": "flex",
+                                    "alignItems": "center",
+                                    "justifyContent": "space-between",  # This spreads the elements
+                                    "width": "100%",  # Ensure full width
+                                    "marginBottom": "10px",
+                                },
+                            ),
+                            dag.AgGrid(
+                                id="keys-table",
+                                rowData=[],
+                                columnDefs=[
+                                    {"field": "key", "headerName": "Key", "flex": 2},
+                                    {"field": "ttl", "headerName": "TTL", "flex": 1},
+                                    {
+                                        "field": "size",
+                                        "headerName": "Size (KB)",
+                                        "flex": 1,
+                                    },
+                                    {
+                                        "field": "serialization",
+                                        "headerName": "Serialization",
+                                        "flex": 1,
+                                    },
+                                ],
+                                defaultColDef={
+                                    "resizable": True,
+                                    "sortable": True,
+                                    "filter": True,
+                                },
+                                dashGridOptions={
+                                    "rowSelection": "single",
+                                    "headerClass": "custom-header",
+                                },
+                                style={
+                                    "height": "calc(100vh - 250px)",
+                                    "width": "100%",
+                                    "borderRadius": "8px",
+                                    "--ag-header-background-color": "#654321",
+                                    "--ag-header-foreground-color": "#ffffff",
+                                    "--ag-header-height": "45px",
+                                    "--ag-border-radius": "8px",
+                                    "--ag-borders": "solid 1px",
+                                    "--ag-border-color": "#4d4d4d",
+                                },
+                                className="ag-theme-alpine-dark",
+                            ),
+                        ],
+                        style={
+                            "width": "40%",
+                            "display": "inline-block",
+                            "verticalAlign": "top",
+                            "paddingRight": "20px",
+                            "height": "calc(100vh - 190px)",
+                        },
+                    ),
+                    # Right column - JSON Preview
+                    html.Div(
+                        [
+                            html.Div(
+                                [
+                                    html.H3(
+                                        "DECODED VALUE",
+                                        style={
+                                            "fontSize": "22px",
+                                            "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
+                                            "fontWeight": "600",
+                                            "letterSpacing": "1px",
+                                            "textTransform": "uppercase",
+                                            "color": "#ffffff",
+                                            "marginBottom": "15px",
+                                            "display": "inline-block",
+                                        },
+                                    ),
+                                ],
+                                style={
+                                    "display": "flex",
+                                    "justifyContent": "space-between",
+                                    "alignItems": "center",
+                                },
+                            ),
+                            html.Div(
+                                # Spinner shows while the selected value is being decoded
+                                dcc.Loading(
+                                    [
+                                        dcc.Store(id="preview-data"),
+                                        # Static shell loaded once; values arrive via postMessage
+                                        html.Iframe(
+                                            id="preview-frame",
+                                            src="/assets/preview.html",
                                             style={
-                                                "fontSize": "22px",
-                                                "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
-                                                "fontWeight": "600",
-                                                "letterSpacing": "1px",
-                                                "textTransform": "uppercase",
-                                                "color": "#ffffff",
-                                                "marginBottom": "5px",
-                                                "display": "inline-block",
-                                                "marginRight": "5px",
+                                                "width": "100%",
+                                                "height": "100%",
+                                                "border": "none",
+                                                "backgroundColor": "#272822",
                                             },
                                         ),
-                                        html.Button(
-                                            html.I(className="fas fa-sync-alt"),
-                                            id="refresh-button",
-                                            className="refresh-button",
-                                            n_clicks=0,
-                                        ),
                                     ],
-                                    style={
-                                        "display": "flex",
-                                        "alignItems": "center",
-                                    },
-                                ),
-                                # Right side - Total Keys
-                                html.H1(
-                                    id="total-keys",
-                                    style={
-                                        "color": "#a6a6a6",
-                                        "fontSize": "14px",
-                                        "fontFamily": "'Inter', sans-serif",
-                                        "marginBottom": "5px",
-                                        "lineHeight": "22px",
-                                        "paddingTop": "15px",
-                                    },
+                                    type="circle",
+                                    color="#a6a6a6",
+                                    parent_style={"height": "100%"},
                                 ),
-                            ],
-                            style={
-                                "display": "flex",
-                                "alignItems": "center",
-                                "justifyContent": "space-between",  # This spreads the elements
-                                "width": "100%",  # Ensure full width
-                                "marginBottom": "10px",
-                            },
-                        ),
-                        dag.AgGrid(
-                            id="keys-table",
-                            rowData=[],
-                            columnDefs=[
-                                {"field": "key", "headerName": "Key", "flex": 2},
-                                {"field": "ttl", "headerName": "TTL", "flex": 1},
-                                {"field": "size", "headerName": "Size (KB)", "flex": 1},
-                                {
-                                    "field": "serialization",
-                                    "headerName": "Serialization",
-                                    "flex": 1,
+                                id="json-preview",
+                                style={
+                                    "height": "calc(100vh - 295px)",
+                                    "overflowY": "auto",
+                                    "backgroundColor": "#272822",
+                                    "padding": "20px",
+                                    "borderRadius": "8px",
+                                    "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
+                                    "color": "#ffffff",
                                 },
-                            ],
-                            defaultColDef={
-                                "resizable": True,
-                                "sortable": True,
-                                "filter": True,
-                            },
-                            dashGridOptions={
-                                "rowSelection": "single",
-                                "headerClass": "custom-header",
-                            },
-                            style={
-                                "height": "calc(100vh - 250px)",
-                                "width": "100%",
-                                "borderRadius": "8px",
-                                "--ag-header-background-color": "#654321",
-                                "--ag-header-foreground-color": "#ffffff",
-                                "--ag-header-height": "45px",
-                                "--ag-border-radius": "8px",
-                                "--ag-borders": "solid 1px",
-                                "--ag-border-color": "#4d4d4d",
-                            },
-                            className="ag-theme-alpine-dark",
-                        ),
-                    ],
-                    style={
-                        "width": "40%",
-                        "display": "inline-block",
-                        "verticalAlign": "top",
-                        "paddingRight": "20px",
-                        "height": "calc(100vh - 190px)",
-                    },
-                ),
-                # Right column - JSON Preview
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                html.H3(
-                                    "DECODED VALUE",
-                                    style={
-                                        "fontSize": "22px",
-                                        "fontFamily": "'Inter', 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif",
-                                        "fontWeight": "600",
-                                        "letterSpacing": "1px",
-                                        "textTransform": "uppercase",
-                                        "color": "#ffffff",
-                                        "marginBottom": "15px",
-                                        "display": "inline-block",
-                                    },
-                                ),
-                            ],
-                            style={
-                                "display": "flex",
-                                "justifyContent": "space-between",
-                                "alignItems": "center",
-                            },
-                        ),
-                        html.Div(
-                            id="json-preview",
-                            style={
-                                "height": "calc(100vh - 295px)",
-                                "overflowY": "auto",
-                                "backgroundColor": "#272822",
-                                "padding": "20px",
-                                "borderRadius": "8px",
-                                "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
-                                "color": "#ffffff",
-                            },
-                        ),
-                    ],
-                    style={
-                        "width": "60%",
-                        "display": "inline-block",
-                        "verticalAlign": "top",
-                        "height": "calc(100vh - 240px)",
-                    },
-                ),
-            ],
-            style={
-                "display": "flex",
-                "flexDirection": "row",
-                "gap": "20px",
-                "height": "calc(100vh - 190px)",
-            },
-        ),
-    ],
-    style={
-        "padding": "20px",
-        "height": "100vh",
-        "backgroundColor": "#2d2d2d",
-        "overflow": "hidden",
-    },
-)
+                            ),
+                        ],
+                        style={
+                            "width": "60%",
+                            "display": "inline-block",
+                            "verticalAlign": "top",
+                            "height": "calc(100vh - 240px)",
+                        },
+                    ),
+                ],
+                style={
+                    "display": "flex",
+                    "flexDirection": "row",
+                    "gap": "20px",
+                    "height": "calc(100vh - 190px)",
+                },
+            ),
+        ],
+        style={
+            "padding": "20px",
+            "height": "100vh",
+            "backgroundColor": "#2d2d2d",
+            "overflow": "hidden",
+        },
+    )
 
 
-@app.callback(
+@callback(
     Output("keys-table", "rowData"),
     [
         Input("search-pattern", "value"),
@@ -523,174 +657,85 @@ app.layout = html.Div(
     ],
 )
 def update_keys_table(pattern, _, n_clicks):
-    # First get all keys
-    all_keys = cache_viewer.get_keys("*")
-    row_data = []
-
-    # Convert pattern to lowercase for case-insensitive matching
-    pattern = pattern.lower() if pattern else "*"
-
-    for key in all_keys:
-        # Extract the display key (part after "go.")
-        display_key = key.split("go.", 1)[1] if "go." in key else key
-
-        # Only add to row_data if the display_key matches the pattern
-        if pattern == "*" or pattern.lower() in display_key.lower():
-            size_in_kb = None
-            try:
-                size_in_bytes = cache_viewer.get_object_size(key)
-                if size_in_bytes is not None:
-                    size_in_kb = round(size_in_bytes / 1024, 2)  # Convert to KB
-            except Exception as e:
-                size_in_kb = "Error"
-
-            row_data.append(
-                {
-                    "key": display_key,  # Display shortened key
-                    "original_key": key,  # Keep original key for value lookup
-                    "ttl": cache_viewer.get_ttl(key),
-                    "size": size_in_kb,
-                    "serialization": get_serialization_type(key).value,
-                }
-            )
-
-    # Sort the filtered results by display key
-    row_data.sort(key=lambda x: x["key"].lower())
-    return row_data
+    # Redis filters the keys by pattern during SCAN; they come back sorted
+    matching_keys = cache_viewer.get_keys(pattern)
+    original_keys = [key for key, display_key in matching_keys]
+    display_keys = [display_key for key, display_key in matching_keys]
+
+    # Fetch TTL and size for all matching keys in pipelined round-trips
+    metadata = cache_viewer.get_keys_metadata(original_keys)
+
+    # Build each column in its own pass, then zip them into rows once
+    ttls = [ttl for ttl, size_in_bytes in metadata]
+    sizes = [
+        round(size_in_bytes / 1024, 2) if size_in_bytes is not None else None
+        for ttl, size_in_bytes in metadata
+    ]  # Convert to KB
+    serializations = [get_serialization_type(key).value for key in original_keys]
+    compressions = [get_compression_algorithm(key).value for key in original_keys]
+
+    return [
+        {
+            "key": display_key,  # Display shortened key
+            "original_key": key,  # Keep original key for value lookup
+            "ttl": ttl,
+            "size": size_in_kb,
+            "serialization": serialization,
+            "compression": compression,
+        }
+        for display_key, key, ttl, size_in_kb, serialization, compression in zip(
+            display_keys, original_keys, ttls, sizes, serializations, compressions
+        )
+    ]
 
 
-# Update the value preview callback to use the original key
-@app.callback(Output("json-preview", "children"), Input("keys-table", "selectedRows"))
+# Send the selected value to the preview frame; rendering happens in assets/preview.html
+@callback(Output("preview-data", "data"), Input("keys-table", "selectedRows"))
 def update_value_preview(selected_rows):
     if not selected_rows or len(selected_rows) == 0:
-        return html.Div(
-            "No key selected",
-            style={
-                "fontSize": "18px",
-                "color": "#75715e",
-                "margin": "10px",
-                "fontFamily": "monospace",
-            },
-        )
+        return {"message": "No key selected"}
 
-    # Use the original key for lookup
-    selected_key = selected_rows[0]["original_key"]
-    value = cache_viewer.get_value(selected_key)
+    # Use the original key for lookup, with the formats resolved when the table was built
+    selected_row = selected_rows[0]
+    selected_key = selected_row["original_key"]
+    # Row data comes from the browser; get_value re-derives formats given None
+    try:
+        compression_algorithm = CompressionAlgorithm(selected_row.get("compression"))
+    except ValueError:
+        compression_algorithm = None
+    try:
+        serialization_type = SerializationType(selected_row.get("serialization"))
+    except ValueError:
+        serialization_type = None
+    value = cache_viewer.get_value(
+        selected_key, compression_algorithm, serialization_type
+    )
 
     if value:
-        formatted_json = json.dumps(value, indent=2)
-        highlighted_json = highlight(
-            formatted_json,
-            JsonLexer(),
-            HtmlFormatter(
-                style="monokai",
-                noclasses=True,
-                prestyles="font-family: 'Monaco', 'Consolas', monospace; font-size: 14px; line-height: 1.5;",
-            ),
-        )
-
-        html_content = f"""
-            <html>
-                <body style="margin:0; background-color: #272822;">
-                    <div style="position: absolute; top: 10px; right: 10px;">
-                        <button id="copyButton" onclick="copyToClipboard(`{html_lib.escape(formatted_json)}`);"
-                                style="background-color: #654321; color: white; border: none; 
-                                       padding: 8px 15px; border-radius: 4px; cursor: pointer; 
-                                       font-size: 14px; position: relative;">
-                            Copy JSON
-                        </button>
-                        <button id="copyButton" onclick="clearCache(`{html_lib.escape(selected_key)}`);"
-                                style="background-color: #B21807; color: white; border: none; 
-                                       padding: 8px 15px; border-radius: 4px; cursor: pointer; 
-                                       font-size: 14px; position: relative;">
-                            Clear Cache
-                        </button>
-                    </div>
-                    {highlighted_json}
-                    <script>
-                        function copyToClipboard(text) {{
-                            navigator.clipboard.writeText(text)
-                                .then(() => {{
-                                    const button = document.getElementById('copyButton');
-                                    button.style.backgroundColor = '#4CAF50';
-                                    button.innerText = 'Copied!';
-                                    
-                                    setTimeout(() => {{
-                                        button.style.backgroundColor = '#654321';
-                                        button.innerText = 'Copy JSON';
-                                    }}, 2000);
-                                }})
-                                .catch(err => console.error('Failed to copy:', err));
-                        }}
-                        function clearCache(key) {{
-                            console.log('Clearing key:', key);
-                            fetch('/clear_cache', {{
-                                method: 'POST',
-                                headers: {{
-                                    'Content-Type': 'application/json'
-                                }},
-                                body: JSON.stringify({{
-                                    key: key
-                                }})
-                            }}).then(function(response) {{
-                                if (response.ok) {{
-                                    // Update the preview to show "No value found" message
-                                    document.body.innerHTML = '<div style="font-size: 18px; color: #75715e; margin: 10px; font-family: monospace;">Cache Key Cleared</div>';
-                                    
-                                    // Properly trigger the refresh using Dash's setProps
-                                    const refreshStore = window.parent.document.getElementById('refresh-trigger');
-                                    if (refreshStore && refreshStore._dashprivate_) {{
-                                        refreshStore._dashprivate_.setProps({{
-                                            data: Date.now()
-                                        }});
-                                    }}
-                                    
-                                    // Clear the grid selection
-                                    const gridDiv = window.parent.document.querySelector('.ag-theme-alpine-dark');
-                                    if (gridDiv && gridDiv.__dashAgGridComponentFunctions) {{
-                                        const api = gridDiv.__dashAgGridComponentFunctions.getApi();
-                                        if (api) {{
-                                            api.deselectAll();
-                                        }}
-                                    }}
-                                }} else {{
-                                    response.json().then(function(data) {{
-                                        alert('Failed to clear cache key: ' + data.message);
-                                    }});
-                                }}
-                            }}).catch(function(err) {{
-                                console.error('Failed to clear cache:', err);
-                                alert('Failed to clear cache: ' + err);
-                            }});
-                        }}
-                    </script>
-                </body>
-            </html>
-        """
-
-        return html.Iframe(
-            srcDoc=html_content,
-            style={
-                "width": "100%",
-                "height": "100%",
-                "border": "none",
-                "backgroundColor": "#272822",
-            },
-        )
-
-    return html.Div(
-        "No value found for this key",
-        style={
-            "font-size": "18px",
-            "color": "#75715e",
-            "margin": "10px",
-            "fontFamily": "monospace",
-        },
-    )
+        return {"key": selected_key, "json": format_json(value)}
+
+    return {"message": "No value found for this key"}
+
+
+clientside_callback(
+    """
+    function(data) {
+        // Kept on the parent so the frame can render it if it loads later
+        window.latestPreviewData = data;
+        const frame = document.getElementById('preview-frame');
+        if (frame && frame.contentWindow) {
+            frame.contentWindow.postMessage(data, window.location.origin);
+        }
+        return window.dash_clientside.no_update;
+    }
+    """,
+    Output("preview-frame", "title"),
+    Input("preview-data", "data"),
+)
 
 
 # Add a new callback to update the total keys count
-@app.callback(Output("total-keys", "children"), Input("keys-table", "rowData"))
+@callback(Output("total-keys", "children"), Input("keys-table", "rowData"))
 def update_total_keys(row_data):
     if row_data:
         return f"Total Keys: {len(row_data)}"
@@ -704,21 +749,50 @@ def open_browser():
     webbrowser.get(chrome_path).open(f"http://127.0.0.1:{port}")
 
 
-@app.server.route("/clear_cache", methods=["POST"])
 def clear_cache():
     try:
         data = request.get_json()
-        key = data.get("key")
-        print(f"Clearing key: {key}")
-        if key and cache_viewer.redis_instance.client:
-            cache_viewer.redis_instance.client.delete(key)
-            return jsonify({"status": "success", "cleared_key": key}), 200
+        # Accept {"keys": [...]} for batch deletes, or a single {"key": ...}
+        keys = data.get("keys") or ([data["key"]] if data.get("key") else [])
+        if not isinstance(keys, list) or not all(isinstance(k, str) for k in keys):
+            return (
+                jsonify(
+                    {"status": "failure", "message": "Keys must be a list of strings"}
+                ),
+                400,
+            )
+        cache_viewer.logger.info(f"Clearing keys: {keys}")
+        if keys and cache_viewer.redis_instance.client:
+            # UNLINK frees the values in a Redis background thread instead of blocking
+            cache_viewer.redis_instance.client.unlink(*keys)
+            for key in keys:
+                cache_viewer.invalidate_value(key)
+            return (
+                jsonify(
+                    {"status": "success", "cleared_key": keys[0], "cleared_keys": keys}
+                ),
+                200,
+            )
         return jsonify({"status": "failure", "message": "Key not found"}), 400
     except Exception as e:
         return jsonify({"status": "failure", "message": str(e)}), 500
 
 
+def create_app() -> dash.Dash:
+    global cache_viewer
+    app = dash.Dash(__name__, suppress_callback_exceptions=True)
+    cache_viewer = RedisCacheViewer()
+    app.index_string = INDEX_STRING
+    app.layout = build_layout()
+    app.server.add_url_rule("/clear_cache", view_func=clear_cache, methods=["POST"])
+    return app
+
+
 if __name__ == "__main__":
+    # Must run first: frozen decode workers re-enter here and exit inside it
+    freeze_support()
+    app = create_app()
+
     # Update the way we start the server to avoid showing console
     import subprocess
     import sys